@@ -0,0 +1,78 @@
+import hashlib
+
+from django.core.cache import cache
+from django.db.models import Model
+from rest_framework import status
+from rest_framework.response import Response
+
+
+def get_cache_version_key(model: type[Model]) -> str:
+    return f"{model._meta.label_lower}:version"
+
+
+def get_cache_version(model: type[Model]) -> int:
+    """Return the current cache version of the model's table"""
+    return cache.get(get_cache_version_key(model), 0)
+
+
+def bump_cache_version(model: type[Model]) -> None:
+    """Invalidate every cache entry built from the model's table"""
+    key = get_cache_version_key(model)
+
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, 1, timeout=None)
+
+
+# Cache successful read responses of a viewset. Cached data is keyed by
+# the absolute request URL and the cache versions of ``cache_models``,
+# so any write to one of those models invalidates it.
+class CachedResponseMixin:
+
+    cache_timeout = 60
+    cache_models: tuple[type[Model], ...] = ()
+
+    def get_response_cache_key(self, request) -> str:
+        version_keys = [
+            get_cache_version_key(model) for model in self.cache_models
+        ]
+        versions = cache.get_many(version_keys)
+        url = hashlib.md5(
+            request.build_absolute_uri().encode(),
+            usedforsecurity=False
+        ).hexdigest()
+
+        return (
+            f"response:{self.basename}:{self.action}:"
+            f"{'-'.join(str(versions.get(key, 0)) for key in version_keys)}:"
+            f"{url}"
+        )
+
+    def get_cached_response(self, handler, request, *args, **kwargs):
+        key = self.get_response_cache_key(request)
+        data = cache.get(key)
+
+        if data is not None:
+            return Response(data)
+
+        response = handler(request, *args, **kwargs)
+
+        if response.status_code == status.HTTP_200_OK:
+            cache.set(key, response.data, self.cache_timeout)
+
+        return response
+
+
+class CachedListMixin(CachedResponseMixin):
+    def list(self, request, *args, **kwargs):
+        return self.get_cached_response(
+            super().list, request, *args, **kwargs
+        )
+
+
+class CachedRetrieveMixin(CachedResponseMixin):
+    def retrieve(self, request, *args, **kwargs):
+        return self.get_cached_response(
+            super().retrieve, request, *args, **kwargs
+        )
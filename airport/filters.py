@@ -0,0 +1,116 @@
+from datetime import date, datetime, time, timedelta
+
+from django.utils.timezone import make_aware
+from django_filters import rest_framework as filters
+from django_filters.constants import EMPTY_VALUES
+from django_filters.filters import Filter
+
+from airport.models import Airport, Airplane, Crew, Route, Order, Flight
+
+
+def get_day_range(day: date) -> tuple[datetime, datetime]:
+    """Return the half-open [start, end) datetime bounds of the day"""
+    start = make_aware(datetime.combine(day, time.min))
+    return start, start + timedelta(days=1)
+
+
+class LookupFilterSet(filters.FilterSet):
+    """FilterSet that applies all plain lookups with one filter() call"""
+
+    def filter_queryset(self, queryset):
+        lookups = {}
+
+        for name, value in self.form.cleaned_data.items():
+            query_filter = self.filters[name]
+
+            if (
+                query_filter.method
+                or query_filter.exclude
+                or query_filter.distinct
+                or type(query_filter).filter is not Filter.filter
+            ):
+                queryset = query_filter.filter(queryset, value)
+            elif value not in EMPTY_VALUES:
+                lookups[
+                    f"{query_filter.field_name}__{query_filter.lookup_expr}"
+                ] = value
+
+        if lookups:
+            queryset = queryset.filter(**lookups)
+
+        return queryset
+
+
+class AirportFilter(LookupFilterSet):
+    name = filters.CharFilter(lookup_expr="icontains")
+
+    class Meta:
+        model = Airport
+        fields = ("name",)
+
+
+class AirplaneFilter(LookupFilterSet):
+    name = filters.CharFilter(lookup_expr="icontains")
+
+    class Meta:
+        model = Airplane
+        fields = ("name",)
+
+
+class CrewFilter(LookupFilterSet):
+    first_name = filters.CharFilter(lookup_expr="icontains")
+    last_name = filters.CharFilter(lookup_expr="icontains")
+
+    class Meta:
+        model = Crew
+        fields = ("first_name", "last_name")
+
+
+class RouteFilter(LookupFilterSet):
+    source = filters.CharFilter(
+        field_name="source__name",
+        lookup_expr="icontains"
+    )
+    destination = filters.CharFilter(
+        field_name="destination__name",
+        lookup_expr="icontains"
+    )
+
+    class Meta:
+        model = Route
+        fields = ("source", "destination")
+
+
+class OrderFilter(LookupFilterSet):
+    created_at = filters.DateFilter(method="filter_created_at")
+
+    class Meta:
+        model = Order
+        fields = ("created_at",)
+
+    def filter_created_at(self, queryset, name: str, value: date):
+        start, end = get_day_range(value)
+        return queryset.filter(created_at__gte=start, created_at__lt=end)
+
+
+class FlightFilter(LookupFilterSet):
+    source = filters.CharFilter(
+        field_name="route__source__name",
+        lookup_expr="icontains"
+    )
+    destination = filters.CharFilter(
+        field_name="route__destination__name",
+        lookup_expr="icontains"
+    )
+    departure_date = filters.DateFilter(method="filter_departure_date")
+
+    class Meta:
+        model = Flight
+        fields = ("source", "destination", "departure_date")
+
+    def filter_departure_date(self, queryset, name: str, value: date):
+        start, end = get_day_range(value)
+        return queryset.filter(
+            departure_time__gte=start,
+            departure_time__lt=end
+        )
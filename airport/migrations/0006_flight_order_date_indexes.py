@@ -0,0 +1,27 @@
+# Generated by Django 5.0.2 on 2026-10-15 03:57
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("airport", "0005_airplane_image_alter_ticket_flight_and_more"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="flight",
+            index=models.Index(
+                fields=["departure_time"], name="airport_fli_departu_abe547_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="order",
+            index=models.Index(
+                fields=["created_at"], name="airport_ord_created_ff47a7_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.0.2 on 2026-10-15 04:03
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("airport", "0006_flight_order_date_indexes"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name="airplane",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["name"], name="airplane_name_trgm", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="airport",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["name"], name="airport_name_trgm", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="crew",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["first_name"],
+                name="crew_first_name_trgm",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="crew",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["last_name"],
+                name="crew_last_name_trgm",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+    ]
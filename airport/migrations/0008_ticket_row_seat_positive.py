@@ -0,0 +1,20 @@
+# Generated by Django 5.0.2 on 2026-10-15 04:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("airport", "0007_trigram_name_indexes"),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name="ticket",
+            constraint=models.CheckConstraint(
+                check=models.Q(("row__gte", 1), ("seat__gte", 1)),
+                name="ticket_row_seat_positive",
+            ),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.0.2 on 2026-10-15 04:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("airport", "0008_ticket_row_seat_positive"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="flight",
+            name="airport_fli_departu_abe547_idx",
+        ),
+        migrations.AddIndex(
+            model_name="flight",
+            index=models.Index(
+                fields=["route", "departure_time"],
+                name="airport_fli_route_i_baa295_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="flight",
+            index=models.Index(
+                fields=["departure_time", "route"],
+                name="airport_fli_departu_dd90b5_idx",
+            ),
+        ),
+    ]
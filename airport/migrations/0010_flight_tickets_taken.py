@@ -0,0 +1,69 @@
+# Generated by Django 5.0.2 on 2026-10-15 04:09
+
+from django.db import migrations, models
+
+CREATE_TICKETS_TAKEN_TRIGGERS = """
+CREATE FUNCTION airport_flight_count_tickets_taken() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        UPDATE airport_flight
+        SET tickets_taken = tickets_taken + 1
+        WHERE id = NEW.flight_id;
+    END IF;
+    IF TG_OP IN ('DELETE', 'UPDATE') THEN
+        UPDATE airport_flight
+        SET tickets_taken = tickets_taken - 1
+        WHERE id = OLD.flight_id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER airport_ticket_insert_delete_tickets_taken
+AFTER INSERT OR DELETE ON airport_ticket
+FOR EACH ROW EXECUTE FUNCTION airport_flight_count_tickets_taken();
+
+CREATE TRIGGER airport_ticket_update_tickets_taken
+AFTER UPDATE OF flight_id ON airport_ticket
+FOR EACH ROW
+WHEN (OLD.flight_id IS DISTINCT FROM NEW.flight_id)
+EXECUTE FUNCTION airport_flight_count_tickets_taken();
+"""
+
+DROP_TICKETS_TAKEN_TRIGGERS = """
+DROP TRIGGER airport_ticket_update_tickets_taken ON airport_ticket;
+DROP TRIGGER airport_ticket_insert_delete_tickets_taken ON airport_ticket;
+DROP FUNCTION airport_flight_count_tickets_taken();
+"""
+
+BACKFILL_TICKETS_TAKEN = """
+UPDATE airport_flight
+SET tickets_taken = (
+    SELECT COUNT(*)
+    FROM airport_ticket
+    WHERE airport_ticket.flight_id = airport_flight.id
+);
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("airport", "0009_flight_route_departure_time_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="flight",
+            name="tickets_taken",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunSQL(
+            CREATE_TICKETS_TAKEN_TRIGGERS,
+            reverse_sql=DROP_TICKETS_TAKEN_TRIGGERS,
+        ),
+        migrations.RunSQL(
+            BACKFILL_TICKETS_TAKEN,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
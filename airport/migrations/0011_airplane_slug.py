@@ -0,0 +1,36 @@
+# Generated by Django 5.0.2 on 2026-10-15 04:11
+
+from django.db import migrations, models
+from django.utils.text import slugify
+
+
+def fill_airplane_slugs(apps, schema_editor):
+    Airplane = apps.get_model("airport", "Airplane")
+
+    airplanes = list(Airplane.objects.only("id", "name"))
+    for airplane in airplanes:
+        airplane.slug = slugify(airplane.name)[:255]
+
+    Airplane.objects.bulk_update(airplanes, ["slug"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("airport", "0010_flight_tickets_taken"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="airplane",
+            name="slug",
+            field=models.SlugField(
+                db_index=False, default="", editable=False, max_length=255
+            ),
+            preserve_default=False,
+        ),
+        migrations.RunPython(
+            fill_airplane_slugs,
+            reverse_code=migrations.RunPython.noop,
+        ),
+    ]
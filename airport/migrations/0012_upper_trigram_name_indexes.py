@@ -0,0 +1,69 @@
+# Generated by Django 5.0.2 on 2026-10-15 04:34
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("airport", "0011_airplane_slug"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="airplane",
+            name="airplane_name_trgm",
+        ),
+        migrations.RemoveIndex(
+            model_name="airport",
+            name="airport_name_trgm",
+        ),
+        migrations.RemoveIndex(
+            model_name="crew",
+            name="crew_first_name_trgm",
+        ),
+        migrations.RemoveIndex(
+            model_name="crew",
+            name="crew_last_name_trgm",
+        ),
+        migrations.AddIndex(
+            model_name="airplane",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("name"), name="gin_trgm_ops"
+                ),
+                name="airplane_name_trgm",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="airport",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("name"), name="gin_trgm_ops"
+                ),
+                name="airport_name_trgm",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="crew",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("first_name"),
+                    name="gin_trgm_ops",
+                ),
+                name="crew_first_name_trgm",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="crew",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("last_name"),
+                    name="gin_trgm_ops",
+                ),
+                name="crew_last_name_trgm",
+            ),
+        ),
+    ]
@@ -2,7 +2,9 @@ import os
 import uuid
 
 from django.contrib.auth import get_user_model
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
 from django.utils.text import slugify
 from rest_framework.exceptions import ValidationError
 
@@ -14,6 +16,14 @@ class Airport(models.Model):
     def __str__(self):
         return self.name
 
+    class Meta:
+        indexes = [
+            GinIndex(
+                OpClass(Upper("name"), name="gin_trgm_ops"),
+                name="airport_name_trgm"
+            )
+        ]
+
 
 class AirplaneType(models.Model):
     name = models.CharField(max_length=255)
@@ -24,13 +34,15 @@ class AirplaneType(models.Model):
 
 def airplane_image_file_path(instance, filename):
     _, extension = os.path.splitext(filename)
-    filename = f"{slugify(instance.name)}-{uuid.uuid4()}{extension}"
 
-    return os.path.join("uploads/airplanes/", filename)
+    return (
+        f"uploads/airplanes/{instance.slug}-{uuid.uuid4().hex}{extension}"
+    )
 
 
 class Airplane(models.Model):
     name = models.CharField(max_length=255)
+    slug = models.SlugField(max_length=255, db_index=False, editable=False)
     rows = models.IntegerField()
     seats_in_row = models.IntegerField()
     airplane_type = models.ForeignKey(
@@ -43,6 +55,25 @@ class Airplane(models.Model):
     def __str__(self):
         return self.name
 
+    def save(self, *args, **kwargs) -> None:
+        update_fields = kwargs.get("update_fields")
+
+        if update_fields is None or "name" in update_fields:
+            self.slug = slugify(self.name)[:255]
+
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "slug"}
+
+        super().save(*args, **kwargs)
+
+    class Meta:
+        indexes = [
+            GinIndex(
+                OpClass(Upper("name"), name="gin_trgm_ops"),
+                name="airplane_name_trgm"
+            )
+        ]
+
 
 class Crew(models.Model):
     first_name = models.CharField(max_length=255)
@@ -51,6 +82,18 @@ class Crew(models.Model):
     def __str__(self):
         return f"{self.first_name} {self.last_name}"
 
+    class Meta:
+        indexes = [
+            GinIndex(
+                OpClass(Upper("first_name"), name="gin_trgm_ops"),
+                name="crew_first_name_trgm"
+            ),
+            GinIndex(
+                OpClass(Upper("last_name"), name="gin_trgm_ops"),
+                name="crew_last_name_trgm"
+            )
+        ]
+
 
 class Order(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
@@ -65,6 +108,7 @@ class Order(models.Model):
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [models.Index(fields=["created_at"])]
 
 
 class Route(models.Model):
@@ -99,14 +143,30 @@ class Flight(models.Model):
     departure_time = models.DateTimeField()
     arrival_time = models.DateTimeField()
     crew = models.ManyToManyField(Crew)
+    # Maintained by database triggers on the ticket table
+    tickets_taken = models.PositiveIntegerField(default=0, editable=False)
 
     def __str__(self):
         return (f"{self.airplane.name}-"
                 f"{self.departure_time}:{self.arrival_time}")
 
+    def save(self, *args, **kwargs) -> None:
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key and field.name != "tickets_taken"
+            ]
+
+        super().save(*args, **kwargs)
+
     class Meta:
         default_related_name = "flights"
         ordering = ["departure_time"]
+        indexes = [
+            models.Index(fields=["route", "departure_time"]),
+            models.Index(fields=["departure_time", "route"])
+        ]
 
 
 class Ticket(models.Model):
@@ -128,6 +188,12 @@ class Ticket(models.Model):
     class Meta:
         default_related_name = "tickets"
         unique_together = ("seat", "row", "flight")
+        constraints = [
+            models.CheckConstraint(
+                check=models.Q(row__gte=1) & models.Q(seat__gte=1),
+                name="ticket_row_seat_positive"
+            )
+        ]
 
     @staticmethod
     def validate_seat(
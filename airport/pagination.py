@@ -0,0 +1,117 @@
+import hashlib
+from functools import partial
+from urllib.parse import urlencode
+
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.utils.functional import cached_property
+from rest_framework.pagination import (
+    LimitOffsetPagination,
+    PageNumberPagination
+)
+
+from airport.caching import get_cache_version
+
+
+class CachedCountPaginator(Paginator):
+    """Paginator that reuses a cached COUNT(*) of the object list"""
+
+    def __init__(
+            self,
+            *args,
+            count_cache_key: str,
+            refresh_count: bool,
+            count_cache_timeout: int,
+            **kwargs
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.count_cache_key = count_cache_key
+        self.refresh_count = refresh_count
+        self.count_cache_timeout = count_cache_timeout
+
+    @cached_property
+    def count(self) -> int:
+        if not self.refresh_count:
+            count = cache.get(self.count_cache_key)
+            if count is not None:
+                return count
+
+        count = super().count
+        cache.set(self.count_cache_key, count, self.count_cache_timeout)
+        return count
+
+
+class CachedCountMixin:
+    """
+    Cache the total count of a paginated queryset between page requests.
+
+    The count is recomputed on the first page and reused for the other
+    pages requested by the same user with the same filters. Any write
+    to the paginated model invalidates it.
+    """
+
+    count_cache_timeout = 60
+    pagination_params: tuple[str, ...] = ()
+
+    def get_count_cache_key(self, queryset, request, view) -> str:
+        params = sorted(
+            (key, value)
+            for key, values in request.query_params.lists()
+            if key not in self.pagination_params
+            for value in values
+        )
+        digest = hashlib.md5(
+            urlencode(params).encode(),
+            usedforsecurity=False
+        ).hexdigest()
+
+        return (
+            f"pagination_count:{view.__class__.__name__}:"
+            f"{request.user.id}:{get_cache_version(queryset.model)}:{digest}"
+        )
+
+
+class CachedCountPageNumberPagination(
+    CachedCountMixin,
+    PageNumberPagination
+):
+    pagination_params = ("page", "page_size")
+
+    def paginate_queryset(self, queryset, request, view=None):
+        page_number = request.query_params.get(self.page_query_param, "1")
+        self.django_paginator_class = partial(
+            CachedCountPaginator,
+            count_cache_key=self.get_count_cache_key(queryset, request, view),
+            refresh_count=page_number in ("1", *self.last_page_strings),
+            count_cache_timeout=self.count_cache_timeout
+        )
+        return super().paginate_queryset(queryset, request, view)
+
+
+class CachedCountLimitOffsetPagination(
+    CachedCountMixin,
+    LimitOffsetPagination
+):
+    pagination_params = ("limit", "offset")
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.count_cache_key = self.get_count_cache_key(
+            queryset, request, view
+        )
+        self.refresh_count = not self.get_offset(request)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_count(self, queryset) -> int:
+        if not self.refresh_count:
+            count = cache.get(self.count_cache_key)
+            if count is not None:
+                return count
+
+        count = super().get_count(queryset)
+        cache.set(self.count_cache_key, count, self.count_cache_timeout)
+        return count
+
+
+class OrderPagination(CachedCountPageNumberPagination):
+    page_size = 3
+    max_page_size = 100
@@ -1,5 +1,6 @@
-from django.db import transaction
+from django.db import IntegrityError, transaction
 from rest_framework import serializers
+from rest_framework.settings import api_settings
 
 from airport.models import (
     Airport,
@@ -19,6 +20,15 @@ class AirportSerializer(serializers.ModelSerializer):
         fields = ("id", "name", "closest_big_city")
 
 
+class AirportValuesSerializer(serializers.Serializer):
+    id = serializers.IntegerField(read_only=True)
+    name = serializers.CharField(read_only=True)
+    closest_big_city = serializers.CharField(read_only=True)
+
+    def to_representation(self, instance: dict) -> dict:
+        return instance
+
+
 class AirplaneTypeSerializer(serializers.ModelSerializer):
     class Meta:
         model = AirplaneType
@@ -48,6 +58,13 @@ class AirplaneImageSerializer(serializers.ModelSerializer):
         model = Airplane
         fields = ("id", "image")
 
+    def update(self, instance: Airplane, validated_data) -> Airplane:
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+
+        instance.save(update_fields=list(validated_data))
+        return instance
+
 
 class CrewSerializer(serializers.ModelSerializer):
     class Meta:
@@ -55,6 +72,15 @@ class CrewSerializer(serializers.ModelSerializer):
         fields = ("id", "first_name", "last_name")
 
 
+class CrewValuesSerializer(serializers.Serializer):
+    id = serializers.IntegerField(read_only=True)
+    first_name = serializers.CharField(read_only=True)
+    last_name = serializers.CharField(read_only=True)
+
+    def to_representation(self, instance: dict) -> dict:
+        return instance
+
+
 class RouteSerializer(serializers.ModelSerializer):
     class Meta:
         model = Route
@@ -66,6 +92,29 @@ class RouteListSerializer(RouteSerializer):
     destination = AirportSerializer(many=False, read_only=True)
 
 
+class RouteValuesSerializer(serializers.Serializer):
+    id = serializers.IntegerField(read_only=True)
+    source = AirportValuesSerializer(read_only=True)
+    destination = AirportValuesSerializer(read_only=True)
+    distance = serializers.IntegerField(read_only=True)
+
+    def to_representation(self, instance: dict) -> dict:
+        return {
+            "id": instance["id"],
+            "source": {
+                "id": instance["source__id"],
+                "name": instance["source__name"],
+                "closest_big_city": instance["source__closest_big_city"],
+            },
+            "destination": {
+                "id": instance["destination__id"],
+                "name": instance["destination__name"],
+                "closest_big_city": instance["destination__closest_big_city"],
+            },
+            "distance": instance["distance"],
+        }
+
+
 class FlightSerializer(serializers.ModelSerializer):
     class Meta:
         model = Flight
@@ -150,20 +199,14 @@ class FlightNameSerializer(FlightListSerializer):
 
 
 class TicketSerializer(serializers.ModelSerializer):
-    def validate(self, attrs: dict) -> dict:
-        data = super(TicketSerializer, self).validate(attrs)
-        Ticket.validate_seat(
-            attrs["seat"],
-            attrs["flight"].airplane.seats_in_row,
-            attrs["row"],
-            attrs["flight"].airplane.rows,
-            serializers.ValidationError
-        )
-        return data
+    # Flights and seats are checked for all order tickets at once
+    # in OrderSerializer
+    flight = serializers.IntegerField(source="flight_id")
 
     class Meta:
         model = Ticket
         fields = ("id", "row", "seat", "flight")
+        validators = []
 
 
 class TicketListSerializer(TicketSerializer):
@@ -185,13 +228,91 @@ class OrderSerializer(serializers.ModelSerializer):
         model = Order
         fields = ("id", "tickets", "created_at")
 
+    def validate_tickets(self, tickets_data: list[dict]) -> list[dict]:
+        """Validate every ticket with one flight and one taken-seat query"""
+        flight_ids = {ticket_data["flight_id"] for ticket_data in tickets_data}
+        airplanes = {
+            flight_id: (rows, seats_in_row)
+            for flight_id, rows, seats_in_row in Flight.objects.filter(
+                id__in=flight_ids
+            ).values_list("id", "airplane__rows", "airplane__seats_in_row")
+        }
+        errors = [{} for _ in tickets_data]
+
+        for ticket_data, error in zip(tickets_data, errors):
+            flight_id = ticket_data["flight_id"]
+
+            if flight_id not in airplanes:
+                error["flight"] = [
+                    serializers.PrimaryKeyRelatedField.default_error_messages[
+                        "does_not_exist"
+                    ].format(pk_value=flight_id)
+                ]
+                continue
+
+            rows, seats_in_row = airplanes[flight_id]
+            try:
+                Ticket.validate_seat(
+                    ticket_data["seat"],
+                    seats_in_row,
+                    ticket_data["row"],
+                    rows,
+                    serializers.ValidationError
+                )
+            except serializers.ValidationError as exc:
+                error.update(serializers.as_serializer_error(exc))
+
+        if any(errors):
+            raise serializers.ValidationError(errors)
+
+        seats = [
+            (ticket_data["flight_id"], ticket_data["row"], ticket_data["seat"])
+            for ticket_data in tickets_data
+        ]
+        taken_seats = set(
+            Ticket.objects.filter(
+                flight_id__in=airplanes,
+                row__in={row for _, row, _ in seats},
+                seat__in={seat for _, _, seat in seats}
+            ).values_list("flight_id", "row", "seat")
+        )
+        booked_seats = set()
+
+        for (flight_id, row, seat), error in zip(seats, errors):
+            if (flight_id, row, seat) in taken_seats:
+                error[api_settings.NON_FIELD_ERRORS_KEY] = [
+                    f"seat {seat} in row {row} is already taken"
+                ]
+            elif (flight_id, row, seat) in booked_seats:
+                error[api_settings.NON_FIELD_ERRORS_KEY] = [
+                    "The same seat is booked more than once"
+                ]
+            booked_seats.add((flight_id, row, seat))
+
+        if any(errors):
+            raise serializers.ValidationError(errors)
+
+        return tickets_data
+
     def create(self, validated_data) -> Order:
-        with transaction.atomic():
-            tickets_data = validated_data.pop("tickets")
-            order = Order.objects.create(**validated_data)
-            for ticket_data in tickets_data:
-                Ticket.objects.create(order=order, **ticket_data)
-            return order
+        tickets_data = validated_data.pop("tickets")
+
+        try:
+            with transaction.atomic():
+                order = Order.objects.create(**validated_data)
+                Ticket.objects.bulk_create(
+                    [
+                        Ticket(order=order, **ticket_data)
+                        for ticket_data in tickets_data
+                    ],
+                    batch_size=500
+                )
+        except IntegrityError:
+            raise serializers.ValidationError(
+                {"tickets": "Some of the seats have just been taken"}
+            )
+
+        return order
 
 
 class OrderListSerializer(OrderSerializer):
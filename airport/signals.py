@@ -0,0 +1,13 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from airport.caching import bump_cache_version
+
+
+@receiver([post_save, post_delete])
+def invalidate_model_cache(sender, **kwargs) -> None:
+    # Bump only after commit, so a concurrent read cannot cache data
+    # without the write under the new version
+    if sender._meta.app_label == "airport":
+        transaction.on_commit(lambda: bump_cache_version(sender))
@@ -1,8 +1,10 @@
 import os
 import tempfile
+from unittest.mock import patch
 
 from PIL import Image
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.test import TestCase
 from rest_framework import status
 from rest_framework.reverse import reverse
@@ -28,6 +30,7 @@ def image_upload_url(airplane_id: int):
 
 class AuthenticatedAirplaneApiTests(TestCase):
     def setUp(self):
+        cache.clear()
         self.client = APIClient()
         self.user = get_user_model().objects.create_user(
             "user@test.com", "password"
@@ -42,6 +45,7 @@ class AuthenticatedAirplaneApiTests(TestCase):
 
 class AdminAirplaneApiTests(TestCase):
     def setUp(self):
+        cache.clear()
         self.client = APIClient()
         self.user = get_user_model().objects.create_superuser(
             "admin@myproject.com", "password"
@@ -70,6 +74,7 @@ class AdminAirplaneApiTests(TestCase):
 
 class AirplaneImageUploadTests(TestCase):
     def setUp(self):
+        cache.clear()
         self.client = APIClient()
         self.user = get_user_model().objects.create_superuser(
             "admin@myproject.com", "password"
@@ -98,6 +103,40 @@ class AirplaneImageUploadTests(TestCase):
         self.assertIn("image", res.data)
         self.assertTrue(os.path.exists(self.airplane.image.path))
 
+    def test_image_file_name_uses_airplane_slug(self):
+        self.airplane.name = "Boeing 737 MAX"
+        self.airplane.save()
+
+        url = image_upload_url(self.airplane.id)
+        with tempfile.NamedTemporaryFile(suffix=".jpg") as ntf:
+            img = Image.new("RGB", (10, 10))
+            img.save(ntf, format="JPEG")
+            ntf.seek(0)
+            self.client.post(url, {"image": ntf}, format="multipart")
+        self.airplane.refresh_from_db()
+
+        self.assertTrue(
+            os.path.basename(self.airplane.image.name).startswith(
+                "boeing-737-max-"
+            )
+        )
+
+    def test_upload_image_does_not_slugify_name(self):
+        url = image_upload_url(self.airplane.id)
+        with tempfile.NamedTemporaryFile(suffix=".jpg") as ntf:
+            img = Image.new("RGB", (10, 10))
+            img.save(ntf, format="JPEG")
+            ntf.seek(0)
+            with patch("airport.models.slugify") as slugify:
+                res = self.client.post(
+                    url,
+                    {"image": ntf},
+                    format="multipart"
+                )
+
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        slugify.assert_not_called()
+
     def test_upload_image_bad_request(self):
         """Test uploading an invalid image"""
         url = image_upload_url(self.airplane.id)
@@ -1,5 +1,8 @@
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from rest_framework import status
 from rest_framework.reverse import reverse
 from rest_framework.test import APIClient
@@ -13,6 +16,7 @@ AIRPORT_URL = reverse("airport:airport-list")
 
 class UnauthenticatedAirportApiTests(TestCase):
     def setUp(self):
+        cache.clear()
         self.client = APIClient()
 
     def test_auth_required(self):
@@ -22,6 +26,7 @@ class UnauthenticatedAirportApiTests(TestCase):
 
 class AuthenticatedAirportApiTests(TestCase):
     def setUp(self):
+        cache.clear()
         self.client = APIClient()
         self.user = get_user_model().objects.create_user(
             "user@test.com", "password"
@@ -40,6 +45,18 @@ class AuthenticatedAirportApiTests(TestCase):
         self.assertEqual(res.status_code, status.HTTP_200_OK)
         self.assertEqual(res.data["results"], serializer.data)
 
+    def test_airports_list_is_served_from_cache(self):
+        self.client.get(AIRPORT_URL)
+
+        with self.assertNumQueries(0):
+            res = self.client.get(AIRPORT_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            res.data["results"],
+            AirportSerializer(Airport.objects.all(), many=True).data
+        )
+
     def test_filter_airports_by_name(self):
         airport2 = sample_airport(name="Zhylyanu")
 
@@ -51,6 +68,21 @@ class AuthenticatedAirportApiTests(TestCase):
         self.assertNotIn(serializer1.data, res.data["results"])
         self.assertIn(serializer2.data, res.data["results"])
 
+    def test_filter_airports_does_not_use_distinct(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(AIRPORT_URL, {"name": self.airport.name})
+
+        for query in queries:
+            self.assertNotIn("DISTINCT", query["sql"])
+
+    def test_name_filter_can_use_trigram_index(self):
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+
+        plan = Airport.objects.filter(name__icontains="abcd").explain()
+
+        self.assertIn("airport_name_trgm", plan)
+
     def test_create_airport_forbidden(self):
         payload = {
             "name": "Test",
@@ -64,6 +96,7 @@ class AuthenticatedAirportApiTests(TestCase):
 
 class AdminAirportApiTests(TestCase):
     def setUp(self):
+        cache.clear()
         self.client = APIClient()
         self.user = get_user_model().objects.create_superuser(
             "admin@myproject.com", "password"
@@ -84,3 +117,15 @@ class AdminAirportApiTests(TestCase):
         self.assertEqual(res.status_code, status.HTTP_201_CREATED)
         for key in payload:
             self.assertEqual(payload[key], getattr(airport, key))
+
+    def test_create_airport_invalidates_cached_list(self):
+        self.client.get(AIRPORT_URL)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(
+                AIRPORT_URL,
+                {"name": "Test", "closest_big_city": "Test_city"}
+            )
+        res = self.client.get(AIRPORT_URL)
+
+        self.assertEqual(res.data["count"], 2)
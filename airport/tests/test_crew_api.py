@@ -1,4 +1,5 @@
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.test import TestCase
 from rest_framework import status
 from rest_framework.reverse import reverse
@@ -16,6 +17,7 @@ def detail_url(id: int):
 
 class AuthenticatedCrewApiTests(TestCase):
     def setUp(self):
+        cache.clear()
         self.client = APIClient()
         self.user = get_user_model().objects.create_user(
             "user@test.com", "password"
@@ -30,6 +32,7 @@ class AuthenticatedCrewApiTests(TestCase):
 
 class AdminCrewApiTests(TestCase):
     def setUp(self):
+        cache.clear()
         self.client = APIClient()
         self.user = get_user_model().objects.create_superuser(
             "admin@myproject.com", "password"
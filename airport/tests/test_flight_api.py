@@ -1,3 +1,4 @@
+import json
 from datetime import timedelta
 
 from django.utils import timezone
@@ -8,7 +9,7 @@ from rest_framework import status
 from rest_framework.reverse import reverse
 from rest_framework.test import APIClient
 
-from airport.models import Flight
+from airport.models import Flight, Order, Ticket
 from airport.serializers import FlightListSerializer, FlightDetailSerializer
 from airport.tests.samples import (
     sample_flight,
@@ -19,6 +20,7 @@ from airport.tests.samples import (
 )
 
 FLIGHT_URL = reverse("airport:flight-list")
+FLIGHT_EXPORT_URL = reverse("airport:flight-export")
 
 
 class UnauthenticatedFlightApiTests(TestCase):
@@ -52,6 +54,14 @@ class AuthenticatedFlightApiTests(TestCase):
             flight.pop("tickets_available")
             self.assertIn(flight, serializer.data)
 
+    def test_flights_list_does_not_query_per_flight(self):
+        sample_flight()
+
+        with self.assertNumQueries(2):
+            res = self.client.get(FLIGHT_URL)
+
+        self.assertEqual(len(res.data["results"]), 2)
+
     def test_filter_flight_by_source(self):
         source = sample_airport(name="Zhylyanu")
         destination = sample_airport()
@@ -90,6 +100,20 @@ class AuthenticatedFlightApiTests(TestCase):
             if res["id"] == self.flight.id:
                 self.assertNotIn(res, res_filter.data["results"])
 
+    def test_filter_flights_by_source_and_destination(self):
+        source = sample_airport(name="Zhylyanu")
+        destination = sample_airport(name="Lviv")
+        route2 = sample_route(source=source, destination=destination)
+        flight2 = sample_flight(route=route2)
+
+        res = self.client.get(
+            FLIGHT_URL,
+            {"source": "Zhylyanu", "destination": "Lviv"}
+        )
+
+        ids = [flight["id"] for flight in res.data["results"]]
+        self.assertEqual(ids, [flight2.id])
+
     def test_filter_flights_by_departure_date(self):
         source = sample_airport(name="Zhylyanu")
         destination = sample_airport()
@@ -114,6 +138,29 @@ class AuthenticatedFlightApiTests(TestCase):
             if res["id"] == self.flight.id:
                 self.assertNotIn(res, res_filter.data["results"])
 
+    def test_tickets_taken_follows_ticket_changes(self):
+        order = Order.objects.create(user=self.user)
+        ticket = Ticket.objects.create(
+            row=1, seat=1, flight=self.flight, order=order
+        )
+        Ticket.objects.create(row=1, seat=2, flight=self.flight, order=order)
+        ticket.delete()
+
+        self.flight.save()
+        self.flight.refresh_from_db()
+
+        self.assertEqual(self.flight.tickets_taken, 1)
+
+    def test_filter_flights_by_invalid_departure_date(self):
+        res = self.client.get(FLIGHT_URL, {"departure_date": "25.02.2024"})
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_flight_export_forbidden(self):
+        res = self.client.get(FLIGHT_EXPORT_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_403_FORBIDDEN)
+
     def test_flight_create_forbidden(self):
         route = sample_route()
         airplane = sample_airplane()
@@ -141,6 +188,21 @@ class AuthenticatedFlightApiTests(TestCase):
         res.data.pop("tickets_available")
         self.assertEqual(res.data, serializer.data)
 
+    def test_tickets_available_excludes_taken_seats(self):
+        order = Order.objects.create(user=self.user)
+        Ticket.objects.create(row=1, seat=1, flight=self.flight, order=order)
+        Ticket.objects.create(row=1, seat=2, flight=self.flight, order=order)
+
+        url = reverse("airport:flight-detail", args=[self.flight.id])
+        res = self.client.get(url)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            res.data["tickets_available"],
+            res.data["airplane"]["rows"]
+            * res.data["airplane"]["seats_in_row"] - 2
+        )
+
 
 class AdminCrewApiTests(TestCase):
     def setUp(self):
@@ -175,3 +237,14 @@ class AdminCrewApiTests(TestCase):
             if res["id"] == flight.id:
                 res.pop("tickets_available")
                 self.assertEqual(res, serializer.data)
+
+    def test_export_flights(self):
+        sample_flight()
+
+        res = self.client.get(FLIGHT_EXPORT_URL)
+        data = json.loads(b"".join(res.streaming_content))
+
+        res_list = self.client.get(FLIGHT_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(data, res_list.data["results"])
@@ -1,18 +1,27 @@
+import json
 from datetime import timedelta
 from unittest.mock import patch
 
 from django.utils import timezone
 
 from django.contrib.auth import get_user_model
+from django.db import IntegrityError, connection
 from django.test import TestCase
-from rest_framework import status
+from django.test.utils import CaptureQueriesContext
+from rest_framework import serializers, status
 from rest_framework.reverse import reverse
 from rest_framework.test import APIClient
 
-from airport.models import Order
-from airport.serializers import OrderListSerializer, OrderDetailSerializer
+from airport.models import Order, Ticket
+from airport.serializers import (
+    OrderDetailSerializer,
+    OrderListSerializer,
+    OrderSerializer
+)
+from airport.tests.samples import sample_flight
 
 ORDER_URL = reverse("airport:order-list")
+ORDER_EXPORT_URL = reverse("airport:order-export")
 
 
 class UnauthenticatedOrderApiTests(TestCase):
@@ -44,6 +53,57 @@ class AuthenticatedOrderApiTests(TestCase):
         self.assertEqual(res.status_code, status.HTTP_200_OK)
         self.assertEqual(res.data["results"], serializer.data)
 
+    def test_cached_count_is_invalidated_after_commit(self):
+        for _ in range(3):
+            Order.objects.create(user=self.user)
+
+        self.client.get(ORDER_URL)
+        with self.captureOnCommitCallbacks(execute=True):
+            Order.objects.create(user=self.user)
+            res = self.client.get(ORDER_URL, {"page": 2})
+
+        self.assertEqual(res.data["count"], 4)
+        res = self.client.get(ORDER_URL, {"page": 2})
+        self.assertEqual(res.data["count"], 5)
+
+    def test_orders_next_page_reuses_cached_count(self):
+        for _ in range(3):
+            Order.objects.create(user=self.user)
+
+        self.client.get(ORDER_URL)
+        with self.assertNumQueries(2):
+            res = self.client.get(ORDER_URL, {"page": 2})
+
+        self.assertEqual(res.data["count"], 4)
+
+    def test_new_order_invalidates_cached_count(self):
+        for _ in range(3):
+            Order.objects.create(user=self.user)
+
+        self.client.get(ORDER_URL)
+        with self.captureOnCommitCallbacks(execute=True):
+            Order.objects.create(user=self.user)
+        res = self.client.get(ORDER_URL, {"page": 2})
+
+        self.assertEqual(res.data["count"], 5)
+
+    def test_export_orders(self):
+        for _ in range(3):
+            Order.objects.create(user=self.user)
+        other_user = get_user_model().objects.create_user(
+            "other@test.com", "password"
+        )
+        Order.objects.create(user=other_user)
+
+        res = self.client.get(ORDER_EXPORT_URL)
+        data = json.loads(b"".join(res.streaming_content))
+
+        orders = Order.objects.filter(user=self.user)
+        serializer = OrderListSerializer(orders, many=True)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(data, serializer.data)
+
     def test_filter_orders_by_created_at(self):
         original_now = timezone.now()
 
@@ -69,3 +129,125 @@ class AuthenticatedOrderApiTests(TestCase):
         serializer = OrderDetailSerializer(self.order)
         self.assertEqual(res.status_code, status.HTTP_200_OK)
         self.assertEqual(res.data, serializer.data)
+
+    def test_retrieve_order_does_not_query_per_ticket(self):
+        for row in range(1, 4):
+            Ticket.objects.create(
+                row=row, seat=1, flight=sample_flight(), order=self.order
+            )
+
+        url = reverse("airport:order-detail", args=[self.order.id])
+        with self.assertNumQueries(2):
+            res = self.client.get(url)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(res.data["tickets"]), 3)
+
+    def test_create_order_with_tickets(self):
+        flight = sample_flight()
+        payload = {
+            "tickets": [
+                {"row": 1, "seat": 1, "flight": flight.id},
+                {"row": 1, "seat": 2, "flight": flight.id},
+            ]
+        }
+
+        res = self.client.post(ORDER_URL, payload, format="json")
+
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        order = Order.objects.get(id=res.data["id"])
+        self.assertEqual(order.tickets.count(), 2)
+
+    def test_create_order_fetches_flights_once(self):
+        flight = sample_flight()
+        payload = {
+            "tickets": [
+                {"row": 1, "seat": seat, "flight": flight.id}
+                for seat in range(1, 4)
+            ]
+        }
+
+        with CaptureQueriesContext(connection) as queries:
+            res = self.client.post(ORDER_URL, payload, format="json")
+
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        flight_queries = [
+            query for query in queries
+            if 'FROM "airport_flight"' in query["sql"]
+        ]
+        self.assertEqual(len(flight_queries), 1)
+
+    def test_create_order_with_unknown_flight(self):
+        flight = sample_flight()
+        payload = {
+            "tickets": [
+                {"row": 1, "seat": 1, "flight": flight.id},
+                {"row": 1, "seat": 2, "flight": flight.id + 1},
+            ]
+        }
+
+        res = self.client.post(ORDER_URL, payload, format="json")
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(res.data["tickets"][0], {})
+        self.assertIn("flight", res.data["tickets"][1])
+
+    def test_create_order_with_seat_out_of_range(self):
+        flight = sample_flight()
+        payload = {
+            "tickets": [
+                {"row": 1, "seat": 1, "flight": flight.id},
+                {"row": 1, "seat": 100, "flight": flight.id},
+            ]
+        }
+
+        res = self.client.post(ORDER_URL, payload, format="json")
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(res.data["tickets"][0], {})
+        self.assertIn("seat", res.data["tickets"][1])
+        self.assertFalse(Ticket.objects.filter(flight=flight).exists())
+
+    def test_create_order_with_taken_seat(self):
+        flight = sample_flight()
+        Ticket.objects.create(row=1, seat=2, flight=flight, order=self.order)
+        payload = {
+            "tickets": [
+                {"row": 1, "seat": 1, "flight": flight.id},
+                {"row": 1, "seat": 2, "flight": flight.id},
+            ]
+        }
+
+        res = self.client.post(ORDER_URL, payload, format="json")
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(Ticket.objects.filter(flight=flight).count(), 1)
+
+    def test_create_order_with_duplicate_seats(self):
+        flight = sample_flight()
+        payload = {
+            "tickets": [
+                {"row": 1, "seat": 1, "flight": flight.id},
+                {"row": 1, "seat": 1, "flight": flight.id},
+            ]
+        }
+
+        res = self.client.post(ORDER_URL, payload, format="json")
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Ticket.objects.filter(flight=flight).exists())
+
+    def test_failed_ticket_insert_does_not_keep_order(self):
+        flight = sample_flight()
+        serializer = OrderSerializer(
+            data={"tickets": [{"row": 1, "seat": 1, "flight": flight.id}]}
+        )
+        serializer.is_valid(raise_exception=True)
+
+        with patch.object(
+            Ticket.objects, "bulk_create", side_effect=IntegrityError
+        ):
+            with self.assertRaises(serializers.ValidationError):
+                serializer.save(user=self.user)
+
+        self.assertEqual(Order.objects.filter(user=self.user).count(), 1)
@@ -1,4 +1,5 @@
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.test import TestCase
 from rest_framework import status
 from rest_framework.reverse import reverse
@@ -16,6 +17,7 @@ def detail_url(id: int):
 
 class AuthenticatedRouteApiTests(TestCase):
     def setUp(self):
+        cache.clear()
         self.client = APIClient()
         self.user = get_user_model().objects.create_user(
             "user@test.com", "password"
@@ -30,6 +32,7 @@ class AuthenticatedRouteApiTests(TestCase):
 
 class AdminRouteApiTests(TestCase):
     def setUp(self):
+        cache.clear()
         self.client = APIClient()
         self.user = get_user_model().objects.create_superuser(
             "admin@myproject.com", "password"
@@ -69,6 +72,30 @@ class AdminRouteApiTests(TestCase):
         self.assertNotIn(serializer1.data, res.data["results"])
         self.assertIn(serializer2.data, res.data["results"])
 
+    def test_list_routes_payload(self):
+        res = self.client.get(ROUTE_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            res.json()["results"],
+            [
+                {
+                    "id": self.route.id,
+                    "source": {
+                        "id": self.route.source.id,
+                        "name": "Boruspil",
+                        "closest_big_city": "Kyiv",
+                    },
+                    "destination": {
+                        "id": self.route.destination.id,
+                        "name": "Zhylyanu",
+                        "closest_big_city": "Kyiv",
+                    },
+                    "distance": 13,
+                }
+            ]
+        )
+
     def test_delete_route(self):
         """If we have 404 error that indicates that
             we don`t have any of detail actions"""
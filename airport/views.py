@@ -1,15 +1,24 @@
-from datetime import datetime
+from collections.abc import Iterator
 
-from django.db.models import Count, F
+from django.db import transaction
+from django.db.models import F, Prefetch
+from django.http import StreamingHttpResponse
 from drf_spectacular.utils import extend_schema, OpenApiParameter
 from rest_framework import viewsets, status, mixins
 from rest_framework.decorators import action
-from rest_framework.pagination import PageNumberPagination
 from rest_framework.permissions import IsAdminUser, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.viewsets import GenericViewSet
-from rest_framework_simplejwt.authentication import JWTAuthentication
 
+from airport.caching import CachedListMixin, CachedRetrieveMixin
+from airport.filters import (
+    AirportFilter,
+    AirplaneFilter,
+    CrewFilter,
+    RouteFilter,
+    OrderFilter,
+    FlightFilter
+)
 from airport.models import (
     Airport,
     AirplaneType,
@@ -17,17 +26,24 @@ from airport.models import (
     Crew,
     Route,
     Order,
-    Flight
+    Flight,
+    Ticket
+)
+from airport.pagination import (
+    CachedCountLimitOffsetPagination,
+    OrderPagination
 )
 from airport.permissions import IsAdminOrIfAuthenticatedReadOnly
 from airport.serializers import (
     AirportSerializer,
+    AirportValuesSerializer,
     AirplaneTypeSerializer,
     AirplaneSerializer,
     AirplaneListSerializer,
     CrewSerializer,
+    CrewValuesSerializer,
     RouteSerializer,
-    RouteListSerializer,
+    RouteValuesSerializer,
     OrderSerializer,
     FlightSerializer,
     FlightListSerializer,
@@ -36,24 +52,59 @@ from airport.serializers import (
     OrderDetailSerializer,
     AirplaneImageSerializer
 )
+from core.renderers import ORJSONRenderer
+from user.authentication import CachedJWTAuthentication
+
+
+EXPORT_CHUNK_SIZE = 2000
+
+
+def stream_json_array(queryset, serializer) -> Iterator[bytes]:
+    """Serialize the queryset into a JSON array chunk by chunk"""
+    renderer = ORJSONRenderer()
+
+    yield b"["
+    for index, instance in enumerate(
+            queryset.iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    ):
+        if index:
+            yield b","
+        yield renderer.render(serializer.to_representation(instance))
+    yield b"]"
+
+
+def export_response(
+        queryset,
+        serializer,
+        filename: str
+) -> StreamingHttpResponse:
+    response = StreamingHttpResponse(
+        stream_json_array(queryset, serializer),
+        content_type="application/json"
+    )
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
 
 
-class AirportViewSet(viewsets.ModelViewSet):
+class AirportViewSet(
+    CachedListMixin,
+    CachedRetrieveMixin,
+    viewsets.ModelViewSet
+):
     queryset = Airport.objects.all()
     serializer_class = AirportSerializer
-    authentication_classes = (JWTAuthentication,)
+    cache_models = (Airport,)
+    filterset_class = AirportFilter
+    authentication_classes = (CachedJWTAuthentication,)
     permission_classes = (IsAdminOrIfAuthenticatedReadOnly,)
 
     def get_queryset(self) -> Airport:
-        """Retrieve the airports with name"""
-        name = self.request.query_params.get("name")
-
         queryset = self.queryset
 
-        if name:
-            queryset = queryset.filter(name__icontains=name)
+        if self.action == "list":
+            queryset = queryset.values("id", "name", "closest_big_city")
 
-        return queryset.distinct()
+        return queryset
 
     @extend_schema(
         parameters=[
@@ -68,37 +119,46 @@ class AirportViewSet(viewsets.ModelViewSet):
     def list(self, request, *args, **kwargs):
         return super().list(request, *args, **kwargs)
 
+    def get_serializer_class(self):
+        if self.action == "list":
+            return AirportValuesSerializer
+
+        return self.serializer_class
+
 
 class AirplaneTypeViewSet(
+    CachedListMixin,
     mixins.CreateModelMixin,
     mixins.ListModelMixin,
     GenericViewSet
 ):
     queryset = AirplaneType.objects.all()
     serializer_class = AirplaneTypeSerializer
-    authentication_classes = (JWTAuthentication,)
+    cache_models = (AirplaneType,)
+    authentication_classes = (CachedJWTAuthentication,)
     permission_classes = (IsAdminUser,)
 
 
-class AirplaneViewSet(viewsets.ModelViewSet):
+class AirplaneViewSet(
+    CachedListMixin,
+    CachedRetrieveMixin,
+    viewsets.ModelViewSet
+):
     queryset = Airplane.objects.all()
     serializer_class = AirplaneSerializer
-    authentication_classes = (JWTAuthentication,)
+    cache_models = (Airplane, AirplaneType)
+    pagination_class = CachedCountLimitOffsetPagination
+    filterset_class = AirplaneFilter
+    authentication_classes = (CachedJWTAuthentication,)
     permission_classes = (IsAdminUser,)
 
     def get_queryset(self) -> Airplane:
-        """Retrieve the airplanes with name"""
-        name = self.request.query_params.get("name")
-
         queryset = self.queryset
 
-        if name:
-            queryset = queryset.filter(name__icontains=name)
-
         if self.action in ("list", "retrieve"):
             queryset = queryset.select_related("airplane_type")
 
-        return queryset.distinct()
+        return queryset
 
     @extend_schema(
         parameters=[
@@ -140,29 +200,25 @@ class AirplaneViewSet(viewsets.ModelViewSet):
 
 
 class CrewViewSet(
+    CachedListMixin,
     mixins.CreateModelMixin,
     mixins.ListModelMixin,
     GenericViewSet
 ):
     queryset = Crew.objects.all()
     serializer_class = CrewSerializer
-    authentication_classes = (JWTAuthentication,)
+    cache_models = (Crew,)
+    filterset_class = CrewFilter
+    authentication_classes = (CachedJWTAuthentication,)
     permission_classes = (IsAdminUser,)
 
     def get_queryset(self) -> Crew:
-        """Retrieve the crews with first_name and last_name"""
-        first_name = self.request.query_params.get("first_name")
-        last_name = self.request.query_params.get("last_name")
-
         queryset = self.queryset
 
-        if first_name:
-            queryset = queryset.filter(first_name__icontains=first_name)
-
-        if last_name:
-            queryset = queryset.filter(last_name__icontains=last_name)
+        if self.action == "list":
+            queryset = queryset.values("id", "first_name", "last_name")
 
-        return queryset.distinct()
+        return queryset
 
     @extend_schema(
         parameters=[
@@ -183,36 +239,42 @@ class CrewViewSet(
     def list(self, request, *args, **kwargs):
         return super().list(request, *args, **kwargs)
 
+    def get_serializer_class(self):
+        if self.action == "list":
+            return CrewValuesSerializer
+
+        return self.serializer_class
+
 
 class RouteViewSet(
+    CachedListMixin,
     mixins.CreateModelMixin,
     mixins.ListModelMixin,
     GenericViewSet
 ):
     queryset = Route.objects.all()
     serializer_class = RouteSerializer
-    authentication_classes = (JWTAuthentication,)
+    cache_models = (Route, Airport)
+    filterset_class = RouteFilter
+    authentication_classes = (CachedJWTAuthentication,)
     permission_classes = (IsAdminUser,)
 
     def get_queryset(self) -> Route:
-        """Retrieve the crews with first_name and last_name"""
-        source = self.request.query_params.get("source")
-        destination = self.request.query_params.get("destination")
-
         queryset = self.queryset
 
-        if source:
-            queryset = queryset.filter(source__name__icontains=source)
-
-        if destination:
-            queryset = queryset.filter(
-                destination__name__icontains=destination
+        if self.action == "list":
+            queryset = queryset.values(
+                "id",
+                "distance",
+                "source__id",
+                "source__name",
+                "source__closest_big_city",
+                "destination__id",
+                "destination__name",
+                "destination__closest_big_city"
             )
 
-        if self.action in ("list", "retrieve"):
-            queryset = queryset.select_related("source", "destination")
-
-        return queryset.distinct()
+        return queryset
 
     @extend_schema(
         parameters=[
@@ -235,17 +297,12 @@ class RouteViewSet(
     def get_serializer_class(self):
         serializer = self.serializer_class
 
-        if self.action in ("list", "retrieve"):
-            serializer = RouteListSerializer
+        if self.action == "list":
+            serializer = RouteValuesSerializer
 
         return serializer
 
 
-class OrderPagination(PageNumberPagination):
-    page_size = 3
-    max_page_size = 100
-
-
 class OrderViewSet(
     mixins.CreateModelMixin,
     mixins.ListModelMixin,
@@ -255,33 +312,46 @@ class OrderViewSet(
     queryset = Order.objects.all()
     serializer_class = OrderSerializer
     pagination_class = OrderPagination
-    authentication_classes = (JWTAuthentication,)
+    filterset_class = OrderFilter
+    authentication_classes = (CachedJWTAuthentication,)
     permission_classes = (IsAuthenticated,)
 
     def get_queryset(self) -> Order:
-        date = self.request.query_params.get("created_at")
+        queryset = self.queryset.filter(user=self.request.user.id)
 
-        queryset = self.queryset
-
-        if date:
-            date = datetime.strptime(date, "%Y-%m-%d").date()
-            queryset = queryset.filter(created_at__date=date)
-
-        if self.action in ("list", "retrieve"):
+        if self.action in ("list", "retrieve", "export"):
             queryset = queryset.prefetch_related(
-                "tickets__flight__route__source",
-                "tickets__flight__route__destination"
+                Prefetch(
+                    "tickets",
+                    queryset=Ticket.objects.select_related(
+                        "flight__route__source",
+                        "flight__route__destination",
+                        "flight__airplane"
+                    ).only(
+                        "id",
+                        "row",
+                        "seat",
+                        "order_id",
+                        "flight__id",
+                        "flight__departure_time",
+                        "flight__arrival_time",
+                        "flight__route__distance",
+                        "flight__route__source__name",
+                        "flight__route__destination__name",
+                        "flight__airplane__name"
+                    )
+                )
             )
 
-        return queryset.filter(user=self.request.user.id)
+        return queryset
 
     @extend_schema(
         parameters=[
             OpenApiParameter(
-                "date",
+                "created_at",
                 type=str,
                 description="Filter by order date"
-                            " (ex. ?date='2024-02-25')"
+                            " (ex. ?created_at='2024-02-25')"
             )
         ]
     )
@@ -291,7 +361,7 @@ class OrderViewSet(
     def get_serializer_class(self):
         serializer = self.serializer_class
 
-        if self.action == "list":
+        if self.action in ("list", "export"):
             serializer = OrderListSerializer
 
         if self.action == "retrieve":
@@ -299,44 +369,41 @@ class OrderViewSet(
 
         return serializer
 
+    @transaction.atomic
     def perform_create(self, serializer) -> None:
         serializer.save(user=self.request.user)
 
+    @extend_schema(responses=OrderListSerializer(many=True))
+    @action(
+        methods=["GET"],
+        detail=False,
+        url_path="export",
+        pagination_class=None,
+    )
+    def export(self, request) -> StreamingHttpResponse:
+        """Endpoint for streaming all user orders without pagination"""
+        return export_response(
+            self.filter_queryset(self.get_queryset()),
+            self.get_serializer(),
+            "orders.json"
+        )
+
 
 class FlightViewSet(viewsets.ModelViewSet):
     queryset = Flight.objects.all()
     serializer_class = FlightSerializer
-    authentication_classes = (JWTAuthentication,)
+    pagination_class = CachedCountLimitOffsetPagination
+    filterset_class = FlightFilter
+    authentication_classes = (CachedJWTAuthentication,)
     permission_classes = (IsAdminOrIfAuthenticatedReadOnly,)
 
     def get_queryset(self) -> Flight:
-        source = self.request.query_params.get("source")
-        destination = self.request.query_params.get("destination")
-        departure_date = self.request.query_params.get("departure_date")
-
         queryset = self.queryset
 
-        if source:
-            queryset = queryset.filter(route__source__name__icontains=source)
-
-        if destination:
-            queryset = queryset.filter(
-                route__destination__name__icontains=destination
-            )
-
-        if departure_date:
-            departure_date = datetime.strptime(
-                departure_date,
-                "%Y-%m-%d"
-            ).date()
-            queryset = queryset.filter(
-                departure_time__icontains=departure_date
-            )
-
         if self.action == "retrieve":
             queryset = queryset.prefetch_related("crew")
 
-        if self.action in ("list", "retrieve"):
+        if self.action in ("list", "retrieve", "export"):
             queryset = (
                 queryset
                 .select_related(
@@ -347,10 +414,13 @@ class FlightViewSet(viewsets.ModelViewSet):
                 .annotate(
                     tickets_available=F("airplane__rows") *
                     F("airplane__seats_in_row") -
-                    Count("taken_seats")
+                    F("tickets_taken")
                 )
             ).order_by("id")
 
+        if self.action in ("list", "export"):
+            queryset = queryset.defer("airplane__image")
+
         return queryset
 
     @extend_schema(
@@ -380,10 +450,26 @@ class FlightViewSet(viewsets.ModelViewSet):
     def get_serializer_class(self):
         serializer = self.serializer_class
 
-        if self.action == "list":
+        if self.action in ("list", "export"):
             return FlightListSerializer
 
         if self.action == "retrieve":
             return FlightDetailSerializer
 
         return serializer
+
+    @extend_schema(responses=FlightListSerializer(many=True))
+    @action(
+        methods=["GET"],
+        detail=False,
+        url_path="export",
+        permission_classes=[IsAdminUser],
+        pagination_class=None,
+    )
+    def export(self, request) -> StreamingHttpResponse:
+        """Endpoint for streaming all flights without pagination"""
+        return export_response(
+            self.filter_queryset(self.get_queryset()),
+            self.get_serializer(),
+            "flights.json"
+        )
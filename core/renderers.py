@@ -0,0 +1,26 @@
+import orjson
+from rest_framework.renderers import JSONRenderer
+
+
+class ORJSONRenderer(JSONRenderer):
+    """Render JSON with orjson instead of the standard json module"""
+
+    def render(
+            self,
+            data,
+            accepted_media_type=None,
+            renderer_context=None
+    ) -> bytes:
+        if data is None:
+            return b""
+
+        # Let DRF's encoder format datetimes the way JSONRenderer does
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            option |= orjson.OPT_INDENT_2
+
+        return orjson.dumps(
+            data,
+            default=self.encoder_class().default,
+            option=option
+        )
@@ -1,3 +1,38 @@
-from django.test import TestCase
+from datetime import datetime, timezone
+from decimal import Decimal
+from io import BytesIO
 
-# Create your tests here.
+from django.test import SimpleTestCase
+from rest_framework.exceptions import ParseError
+
+from core.parsers import ORJSONParser
+from core.renderers import ORJSONRenderer
+
+
+class ORJSONRendererTests(SimpleTestCase):
+    def test_render_with_drf_encoder_fallback(self):
+        data = {
+            "price": Decimal("9.50"),
+            "created_at": datetime(2024, 2, 25, 12, tzinfo=timezone.utc),
+        }
+
+        content = ORJSONRenderer().render(data)
+
+        self.assertEqual(
+            content,
+            b'{"price":9.5,"created_at":"2024-02-25T12:00:00Z"}'
+        )
+
+    def test_render_none(self):
+        self.assertEqual(ORJSONRenderer().render(None), b"")
+
+
+class ORJSONParserTests(SimpleTestCase):
+    def test_parse(self):
+        data = ORJSONParser().parse(BytesIO(b'{"row": 1, "seat": 2}'))
+
+        self.assertEqual(data, {"row": 1, "seat": 2})
+
+    def test_parse_invalid_json(self):
+        with self.assertRaises(ParseError):
+            ORJSONParser().parse(BytesIO(b"{row: 1"))
@@ -0,0 +1,33 @@
+import time
+
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.tokens import Token
+
+MAX_CACHED_TOKENS = 10_000
+
+_validated_tokens: dict[bytes, Token] = {}
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication that verifies each raw token once per process.
+
+    Validated tokens are kept until they expire, so repeated requests
+    with the same token skip decoding and signature verification.
+    """
+
+    def get_validated_token(self, raw_token: bytes) -> Token:
+        token = _validated_tokens.get(raw_token)
+
+        if token is not None:
+            if token["exp"] > time.time():
+                return token
+            _validated_tokens.pop(raw_token, None)
+
+        token = super().get_validated_token(raw_token)
+
+        if len(_validated_tokens) >= MAX_CACHED_TOKENS:
+            _validated_tokens.clear()
+        _validated_tokens[raw_token] = token
+
+        return token
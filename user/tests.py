@@ -0,0 +1,51 @@
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.tokens import AccessToken
+
+from user.authentication import CachedJWTAuthentication
+
+
+class CachedJWTAuthenticationTests(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            "user@test.com", "password"
+        )
+        self.raw_token = str(AccessToken.for_user(self.user)).encode()
+        self.authentication = CachedJWTAuthentication()
+
+    def test_token_is_validated_once(self):
+        with patch.object(
+            JWTAuthentication,
+            "get_validated_token",
+            autospec=True,
+            side_effect=JWTAuthentication.get_validated_token
+        ) as get_validated_token:
+            first = self.authentication.get_validated_token(self.raw_token)
+            second = self.authentication.get_validated_token(self.raw_token)
+
+        self.assertIs(first, second)
+        self.assertEqual(get_validated_token.call_count, 1)
+
+    def test_expired_token_is_validated_again(self):
+        token = self.authentication.get_validated_token(self.raw_token)
+
+        with patch("user.authentication.time.time", return_value=token["exp"]):
+            with patch.object(
+                JWTAuthentication,
+                "get_validated_token",
+                return_value=token
+            ) as get_validated_token:
+                self.authentication.get_validated_token(self.raw_token)
+
+        self.assertEqual(get_validated_token.call_count, 1)
+
+    def test_schema_declares_jwt_security(self):
+        res = self.client.get(
+            reverse("schema"), HTTP_ACCEPT="application/vnd.oai.openapi+json"
+        )
+
+        self.assertIn("jwtAuth", res.json()["components"]["securitySchemes"])